@@ -71,11 +71,10 @@ def _safe_base64url_encode(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
 
 
-def _canonicalize_key(tenant_id: str, raw_key: str) -> str:
-    """Canonicalize legacy key using secure hash."""
+def _canonicalize_key_bytes(tenant_id: bytes, raw_key: bytes) -> str:
+    """Canonicalize legacy key from pre-encoded tenant id and key bytes."""
     # Create deterministic hash using tenant_id as salt
-    input_data = f"{tenant_id}:{raw_key}".encode('utf-8')
-    hash_bytes = hashlib.sha256(input_data).digest()
+    hash_bytes = hashlib.sha256(tenant_id + b":" + raw_key).digest()
     
     # Take first 16 bytes and base64url encode (22 chars without padding)
     canonical = _safe_base64url_encode(hash_bytes[:16])
@@ -83,6 +82,11 @@ def _canonicalize_key(tenant_id: str, raw_key: str) -> str:
     return canonical
 
 
+def _canonicalize_key(tenant_id: str, raw_key: str) -> str:
+    """Canonicalize legacy key using secure hash."""
+    return _canonicalize_key_bytes(tenant_id.encode('utf-8'), raw_key.encode('utf-8'))
+
+
 def _ensure_safe_first_char(key: str) -> str:
     """Ensure key doesn't start with CSV formula characters."""
     if key and key[0] in CSV_FORMULA_CHARS:
@@ -138,7 +142,7 @@ def resolve_idempotency_key(
         ksuid = _generate_ksuid_like()
         
         # Create hash input with tenant isolation and scope
-        hash_input = f"{tenant_id.value}:{scope_hash}:{ksuid}".encode('utf-8')
+        hash_input = tenant_id.value_bytes + f":{scope_hash}:{ksuid}".encode('utf-8')
         hash_bytes = hashlib.sha256(hash_input).digest()
         
         # Take first 16 bytes and base64url encode for 22-char key
@@ -192,8 +196,8 @@ def resolve_idempotency_key(
         )
         
         # Add scope to canonicalization for method/route isolation
-        canonical_input = f"{scope_hash}:{raw_key}"
-        canonical_key = _canonicalize_key(tenant_id.value, canonical_input)
+        canonical_input = f"{scope_hash}:{raw_key}".encode('utf-8')
+        canonical_key = _canonicalize_key_bytes(tenant_id.value_bytes, canonical_input)
         
         # Ensure safe first character  
         resolved_key = _ensure_safe_first_char(canonical_key)
@@ -220,8 +224,8 @@ def resolve_idempotency_key(
             raise ValueError("Idempotency key cannot start with formula characters")
         
         # Canonicalize to make safe
-        canonical_input = f"{scope_hash}:{raw_key}"
-        canonical_key = _canonicalize_key(tenant_id.value, canonical_input)
+        canonical_input = f"{scope_hash}:{raw_key}".encode('utf-8')
+        canonical_key = _canonicalize_key_bytes(tenant_id.value_bytes, canonical_input)
         resolved_key = _ensure_safe_first_char(canonical_key)
         
         logger.warning(
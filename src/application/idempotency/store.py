@@ -10,12 +10,18 @@ import hashlib
 from src.domain.value_objects import TenantId
 
 
+def _hash_payload(response_data: dict[str, Any]) -> bytes:
+    """Hash response data into a raw SHA-256 digest (key order independent)."""
+    response_str = str(sorted(response_data.items()))
+    return hashlib.sha256(response_str.encode('utf-8')).digest()
+
+
 @dataclass(frozen=True)
 class IdempotencyRecord:
     """Record stored for idempotency tracking."""
     tenant_id: str
     key: str
-    response_hash: str
+    response_hash: bytes
     response_data: dict[str, Any]
     created_at: datetime
     expires_at: datetime
@@ -24,14 +30,15 @@ class IdempotencyRecord:
         """Check if this record has expired."""
         return datetime.now(timezone.utc) > self.expires_at
     
+    @property
+    def response_hash_hex(self) -> str:
+        """Hex encoding of the response hash (for logging/debugging)."""
+        return self.response_hash.hex()
+    
     def matches_response(self, response_data: dict[str, Any]) -> bool:
         """Check if response data matches stored hash using constant-time comparison."""
-        # Create hash of the current response data
-        response_str = str(sorted(response_data.items()))
-        current_hash = hashlib.sha256(response_str.encode('utf-8')).hexdigest()
-        
-        # Constant-time comparison to prevent timing attacks
-        return hmac.compare_digest(self.response_hash, current_hash)
+        # Compare raw digests: half the bytes of the hex form, no per-call encoding
+        return hmac.compare_digest(self.response_hash, _hash_payload(response_data))
 
 
 class IdempotencyStore(ABC):
@@ -138,8 +145,7 @@ class InMemoryIdempotencyStore(IdempotencyStore):
             return existing
         
         # Create response hash
-        response_str = str(sorted(response_data.items()))
-        response_hash = hashlib.sha256(response_str.encode('utf-8')).hexdigest()
+        response_hash = _hash_payload(response_data)
         
         # Create new record
         now = datetime.now(timezone.utc)
@@ -3,15 +3,48 @@
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 from uuid import uuid4
 
 from src.application.errors import RateLimitExceeded, ValidationError
 from src.application.ports import JobRepository, RateLimiter, EventBus, LogPublisher
 from src.domain.job import Job, JobStatus
 from src.domain.value_objects import TenantId, IdempotencyKey, Channel, FileReference, RulesProfileId
-# Removed shared logging imports to maintain clean architecture
-# Logging is now handled through LogPublisher port and domain events
+
+# Graceful handling of logging dependencies
+try:
+    from shared.logging import get_logger
+    from shared.logging.context import get_correlation_id
+except ImportError:
+    # Fallback logging for testing without full dependencies
+    import logging
+    
+    class _KeywordLogger:
+        """Accept structlog-style keyword fields on top of the stdlib logger."""
+        
+        def __init__(self, name: str) -> None:
+            self._logger = logging.getLogger(name)
+        
+        def _log(self, level: int, event: str, **kwargs: Any) -> None:
+            self._logger.log(level, event, extra={"fields": kwargs})
+        
+        def debug(self, event: str, **kwargs: Any) -> None:
+            self._log(logging.DEBUG, event, **kwargs)
+        
+        def info(self, event: str, **kwargs: Any) -> None:
+            self._log(logging.INFO, event, **kwargs)
+        
+        def warning(self, event: str, **kwargs: Any) -> None:
+            self._log(logging.WARNING, event, **kwargs)
+        
+        def error(self, event: str, **kwargs: Any) -> None:
+            self._log(logging.ERROR, event, **kwargs)
+    
+    def get_logger(name: str):
+        return _KeywordLogger(name)
+    
+    def get_correlation_id() -> Optional[str]:
+        return None
 
 
 @dataclass(frozen=True)
@@ -76,7 +109,8 @@ class SubmitJobUseCase:
         job_repository: JobRepository,
         rate_limiter: RateLimiter,
         event_bus: EventBus,
-        log_publisher: LogPublisher
+        log_publisher: LogPublisher,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc)
     ) -> None:
         """
         Initialize use case with dependencies.
@@ -86,13 +120,14 @@ class SubmitJobUseCase:
             rate_limiter: Rate limiter for tenant requests
             event_bus: Event bus for publishing domain events
             log_publisher: Publisher for domain events as logs
+            clock: Source of the timezone-aware submission time for the job and its event
         """
         self._job_repository = job_repository
         self._rate_limiter = rate_limiter
         self._event_bus = event_bus
         self._log_publisher = log_publisher
-        # Removed direct logging - using LogPublisher port instead
-        # self._logger = get_logger("application.submit_job")
+        self._clock = clock
+        self._logger = get_logger("application.submit_job")
     
     def execute(self, request: SubmitJobRequest) -> SubmitJobResponse:
         """
@@ -219,7 +254,7 @@ class SubmitJobUseCase:
         
         # Create job with timing and correlation ID
         job_creation_start = time.time()
-        job = Job.create(tenant_id, correlation_id)
+        job = Job.create(tenant_id, correlation_id, created_at=self._clock())
         job_creation_duration_ms = (time.time() - job_creation_start) * 1000
         
         # Publish domain events from job creation
@@ -277,6 +312,7 @@ class SubmitJobUseCase:
         # Publish domain event
         event = JobSubmittedEvent(
             id=str(uuid4()),
+            time=job.created_at.isoformat(),
             subject=f"job:{saved_job.id}",
             tenant_id=request.tenant_id,
             actor_id=request.seller_id,
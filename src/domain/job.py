@@ -11,7 +11,7 @@ import time
 from dataclasses import dataclass, replace, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import List
+from typing import List, Optional
 from uuid import uuid4
 
 from src.domain.errors import DomainError, InvalidStateTransitionError
@@ -60,13 +60,19 @@ class Job:
             raise DomainError("created_at must be timezone-aware")
     
     @classmethod
-    def create(cls, tenant_id: TenantId, correlation_id: str = None) -> "Job":
+    def create(
+        cls,
+        tenant_id: TenantId,
+        correlation_id: str = None,
+        created_at: Optional[datetime] = None
+    ) -> "Job":
         """
         Factory method to create a new Job.
         
         Args:
             tenant_id: Tenant identifier
             correlation_id: Optional correlation ID for tracing
+            created_at: Optional timezone-aware creation time; defaults to now (UTC)
             
         Returns:
             New Job instance in SUBMITTED status with domain events
@@ -76,7 +82,7 @@ class Job:
             id=JobId(uuid4()),
             tenant_id=tenant_id,
             status=JobStatus.SUBMITTED,
-            created_at=datetime.now(timezone.utc)
+            created_at=created_at or datetime.now(timezone.utc)
         )
         
         creation_duration_ms = (time.time() - start_time) * 1000
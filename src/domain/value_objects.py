@@ -94,6 +94,11 @@ class TenantId:
     def __str__(self) -> str:
         return self.value
     
+    @property
+    def value_bytes(self) -> bytes:
+        """UTF-8 encoding of the normalized value, for hash/HMAC inputs."""
+        return self.value.encode('utf-8')
+    
     def __repr__(self) -> str:
         return f"TenantId('{self.value}')"
 
@@ -1,9 +1,12 @@
 """Fake implementations for testing."""
 
-from typing import Dict, List, Optional, Any
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import DefaultDict, Dict, List, Optional, Sequence, Any
 from dataclasses import dataclass, field
+from unittest.mock import MagicMock
 
-from src.application.ports import JobRepository, RateLimiter, EventBus
+from src.application.ports import JobRepository, RateLimiter, EventBus, LogPublisher
 from src.domain.value_objects import TenantId, IdempotencyKey
 
 
@@ -12,7 +15,8 @@ class FakeJobRepository(JobRepository):
     """Fake job repository for testing."""
     
     _jobs: Dict[str, Any] = field(default_factory=dict)
-    _idempotency_index: Dict[tuple, str] = field(default_factory=dict)
+    # (tenant_id, idempotency_key) -> job, so lookups are a single dict probe
+    _idempotency_index: Dict[tuple, Any] = field(default_factory=dict)
     
     def get_by_id(self, job_id: str) -> Optional[Any]:
         """Get job by ID."""
@@ -20,21 +24,23 @@ class FakeJobRepository(JobRepository):
     
     def get_by_idempotency_key(self, tenant_id: str, idempotency_key: str) -> Optional[Any]:
         """Get job by tenant and idempotency key."""
-        job_id = self._idempotency_index.get((tenant_id, idempotency_key))
-        if job_id:
-            return self._jobs.get(job_id)
-        return None
+        return self._idempotency_index.get((tenant_id, idempotency_key))
     
     def save(self, job: Any) -> Any:
         """Save job to fake storage."""
         self._jobs[job.id] = job
-        if hasattr(job, 'idempotency_key') and job.idempotency_key:
-            self._idempotency_index[(job.tenant_id, job.idempotency_key)] = job.id
+        if getattr(job, 'idempotency_key', None):
+            self._idempotency_index[(job.tenant_id, job.idempotency_key)] = job
         return job
     
     def find_by_idempotency_key(self, tenant_id: TenantId, key: IdempotencyKey) -> Optional[Any]:
         """Find job by tenant and idempotency key (port interface)."""
         return self.get_by_idempotency_key(tenant_id.value, key.value)
+    
+    def reset(self) -> None:
+        """Remove all stored jobs."""
+        self._jobs.clear()
+        self._idempotency_index.clear()
 
 
 @dataclass
@@ -42,21 +48,28 @@ class FakeEventBus(EventBus):
     """Fake event bus for testing."""
     
     published_events: List[Any] = field(default_factory=list)
+    _events_by_type: DefaultDict[str, List[Any]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
     
     def publish(self, event: Any) -> None:
         """Publish event to fake bus."""
         self.published_events.append(event)
+        if hasattr(event, 'type'):
+            self._events_by_type[event.type].append(event)
     
     def clear(self) -> None:
         """Clear published events."""
         self.published_events.clear()
+        self._events_by_type.clear()
+    
+    def reset(self) -> None:
+        """Reset event bus."""
+        self.clear()
     
     def get_events_by_type(self, event_type: str) -> List[Any]:
         """Get events by type."""
-        return [
-            event for event in self.published_events 
-            if hasattr(event, 'type') and event.type == event_type
-        ]
+        return list(self._events_by_type.get(event_type, ()))
 
 
 @dataclass
@@ -89,6 +102,21 @@ class FakeRateLimiter(RateLimiter):
         self._exceeded = False
 
 
+@dataclass
+class FakeLogPublisher(LogPublisher):
+    """Fake log publisher for testing."""
+    
+    published_events: List[Any] = field(default_factory=list)
+    
+    def publish_events(self, events: List[Any]) -> None:
+        """Record published domain events."""
+        self.published_events.extend(events)
+    
+    def reset(self) -> None:
+        """Reset log publisher."""
+        self.published_events.clear()
+
+
 @dataclass
 class FakeObjectStorage:
     """Fake object storage for testing."""
@@ -105,4 +133,20 @@ class FakeObjectStorage:
     
     def get_object(self, file_ref: str) -> Optional[bytes]:
         """Get fake object."""
-        return self._files.get(file_ref)
\ No newline at end of file
+        return self._files.get(file_ref)
+
+
+def fake_port(methods: Sequence[str]) -> SimpleNamespace:
+    """Build a lightweight port fake: a namespace of MagicMock methods.
+    
+    Methods are plain attributes, so configuring and calling them skips spec
+    checks, and each call is still recorded.
+    """
+    return SimpleNamespace(**{method: MagicMock() for method in methods})
+
+
+def reset_fake_port(port: SimpleNamespace) -> SimpleNamespace:
+    """Clear recorded calls and configured return values/side effects."""
+    for method in vars(port).values():
+        method.reset_mock(return_value=True, side_effect=True)
+    return port
@@ -11,6 +11,7 @@ from src.application.idempotency.resolver import (
     validate_resolved_key,
     _is_legacy_key,
     _canonicalize_key,
+    _canonicalize_key_bytes,
     _ensure_safe_first_char,
     _create_scope_hash,
     CSV_FORMULA_CHARS
@@ -292,6 +293,15 @@ class TestHelperFunctions:
         
         assert canonical1 != canonical2
     
+    def test_canonicalize_key_bytes_matches_str_variant(self):
+        """Test that the bytes fast path produces the same key as the str wrapper."""
+        tenant_id = TenantId("t_test123")
+        raw_key = "order.123:item"
+        
+        assert _canonicalize_key_bytes(
+            tenant_id.value_bytes, raw_key.encode("utf-8")
+        ) == _canonicalize_key(tenant_id.value, raw_key)
+    
     def test_ensure_safe_first_char(self):
         """Test CSV formula character prevention."""
         # Safe keys should be unchanged
@@ -7,7 +7,8 @@ from src.application.idempotency.store import (
     IdempotencyStore,
     IdempotencyRecord,
     IdempotencyConflictError,
-    InMemoryIdempotencyStore
+    InMemoryIdempotencyStore,
+    _hash_payload,
 )
 from src.domain.value_objects import TenantId
 
@@ -23,7 +24,7 @@ class TestIdempotencyRecord:
         record = IdempotencyRecord(
             tenant_id="t_test123",
             key="test-key-1234567890",
-            response_hash="hash123",
+            response_hash=b"hash123",
             response_data={"job_id": "job_123", "status": "queued"},
             created_at=now,
             expires_at=expires
@@ -41,7 +42,7 @@ class TestIdempotencyRecord:
         record = IdempotencyRecord(
             tenant_id="t_test123",
             key="test-key-1234567890",
-            response_hash="hash123",
+            response_hash=b"hash123",
             response_data={"job_id": "job_123"},
             created_at=past - timedelta(hours=24),
             expires_at=past
@@ -57,7 +58,7 @@ class TestIdempotencyRecord:
         record = IdempotencyRecord(
             tenant_id="t_test123",
             key="test-key-1234567890",
-            response_hash="dummy",  # Will be computed in matches_response
+            response_hash=_hash_payload(response_data),
             response_data=response_data,
             created_at=datetime.now(timezone.utc),
             expires_at=datetime.now(timezone.utc) + timedelta(hours=24)
@@ -75,6 +76,24 @@ class TestIdempotencyRecord:
         reordered_data = {"status": "queued", "job_id": "job_123", "file_ref": "file.csv"}
         assert record.matches_response(reordered_data)
 
+    def test_record_response_hash_is_raw_digest(self):
+        """Test response hash is stored as raw SHA-256 bytes with hex view."""
+        response_data = {"job_id": "job_123", "status": "queued"}
+        digest = _hash_payload(response_data)
+
+        record = IdempotencyRecord(
+            tenant_id="t_test123",
+            key="test-key-1234567890",
+            response_hash=digest,
+            response_data=response_data,
+            created_at=datetime.now(timezone.utc),
+            expires_at=datetime.now(timezone.utc) + timedelta(hours=24)
+        )
+
+        assert len(record.response_hash) == 32
+        assert record.response_hash_hex == digest.hex()
+        assert len(record.response_hash_hex) == 64
+
 
 class TestInMemoryIdempotencyStore:
     """Test cases for InMemoryIdempotencyStore."""
@@ -0,0 +1,161 @@
+"""Compliance test configuration and shared port fakes."""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import List
+from uuid import uuid4
+
+import pytest
+
+from tests.fakes import fake_port, reset_fake_port
+
+
+_ANONYMIZATION_METHODS = (
+    'hash_field', 'mask_field', 'generalize_field', 'suppress_field',
+    'pseudonymize_field', 'apply_k_anonymity',
+    'add_noise', 'validate_anonymization', 'check_re_identification_risk'
+)
+_DATA_ANALYSIS_METHODS = (
+    'calculate_k_anonymity', 'analyze_uniqueness',
+    'check_l_diversity', 'validate_t_closeness'
+)
+_AUDIT_LOG_METHODS = ('log_anonymization_event',)
+
+_AUDIT_LOG_REPO_METHODS = (
+    'save_log_entry', 'query_logs', 'get_log_by_id',
+    'verify_log_integrity', 'get_logs_by_date_range',
+    'get_logs_by_data_subject', 'update_retention_policy',
+    'generate_compliance_report'
+)
+_IMMUTABLE_STORAGE_METHODS = (
+    'store_immutable_record', 'verify_record_integrity',
+    'get_record_hash', 'verify_audit_trail_integrity'
+)
+_ENCRYPTION_METHODS = ('encrypt_sensitive_data', 'hash_personal_identifiers', 'sanitize_log_data')
+_AUDIT_NOTIFICATION_METHODS = ('notify_audit_anomaly', 'notify_compliance_officer')
+
+_RETENTION_REPO_METHODS = (
+    'save_retention_policy', 'get_retention_policy', 'find_expired_data',
+    'mark_for_deletion', 'update_retention_status', 'get_retention_audit',
+    'find_related_data', 'find_soft_delete_candidates', 'anonymize_personal_data',
+    'get_compliance_status'
+)
+_BACKUP_METHODS = ('delete_from_backups', 'find_backup_locations', 'verify_deletion')
+_CACHE_METHODS = ('clear_cache_entries', 'find_cached_data', 'invalidate_cache')
+_LOG_METHODS = ('purge_logs', 'anonymize_log_entries', 'archive_logs')
+_RETENTION_NOTIFICATION_METHODS = ('notify_retention_expiry', 'notify_deletion_completed')
+_RETENTION_AUDIT_LOG_METHODS = ('log_retention_event',)
+
+
+@dataclass(frozen=True)
+class CompliancePorts:
+    """Fakes for the anonymization, data analysis and audit log ports."""
+    anonymization: SimpleNamespace
+    data_analysis: SimpleNamespace
+    audit_log: SimpleNamespace
+
+    def reset(self) -> None:
+        """Clear recorded calls and configured return values/side effects."""
+        for port in (self.anonymization, self.data_analysis, self.audit_log):
+            reset_fake_port(port)
+
+
+@dataclass(frozen=True)
+class AuditPorts:
+    """Fakes for the audit log repository and its storage, encryption and notification ports."""
+    audit_log_repo: SimpleNamespace
+    immutable_storage: SimpleNamespace
+    encryption: SimpleNamespace
+    notification: SimpleNamespace
+
+    def reset(self) -> None:
+        """Clear recorded calls and configured return values/side effects."""
+        for port in vars(self).values():
+            reset_fake_port(port)
+
+
+@dataclass(frozen=True)
+class RetentionPorts:
+    """Fakes for the data retention repository and deletion ports."""
+    retention_repo: SimpleNamespace
+    backup: SimpleNamespace
+    cache: SimpleNamespace
+    log: SimpleNamespace
+    notification: SimpleNamespace
+    audit_log: SimpleNamespace
+
+    def reset(self) -> None:
+        """Clear recorded calls and configured return values/side effects."""
+        for port in vars(self).values():
+            reset_fake_port(port)
+
+
+@pytest.fixture(scope="module")
+def ports() -> CompliancePorts:
+    """Port fakes built once per module; reset per test by _reset_ports."""
+    return CompliancePorts(
+        anonymization=fake_port(_ANONYMIZATION_METHODS),
+        data_analysis=fake_port(_DATA_ANALYSIS_METHODS),
+        audit_log=fake_port(_AUDIT_LOG_METHODS)
+    )
+
+
+@pytest.fixture
+def _reset_ports(ports: CompliancePorts) -> None:
+    """Reset shared port fakes so each test starts from a clean state."""
+    ports.reset()
+
+
+@pytest.fixture(scope="module")
+def audit_ports() -> AuditPorts:
+    """Audit port fakes built once per module; reset per test by _reset_audit_ports."""
+    return AuditPorts(
+        audit_log_repo=fake_port(_AUDIT_LOG_REPO_METHODS),
+        immutable_storage=fake_port(_IMMUTABLE_STORAGE_METHODS),
+        encryption=fake_port(_ENCRYPTION_METHODS),
+        notification=fake_port(_AUDIT_NOTIFICATION_METHODS)
+    )
+
+
+@pytest.fixture
+def _reset_audit_ports(audit_ports: AuditPorts) -> None:
+    """Reset shared audit port fakes so each test starts from a clean state."""
+    audit_ports.reset()
+
+
+@pytest.fixture(scope="module")
+def retention_ports() -> RetentionPorts:
+    """Retention port fakes built once per module; reset per test by _reset_retention_ports."""
+    return RetentionPorts(
+        retention_repo=fake_port(_RETENTION_REPO_METHODS),
+        backup=fake_port(_BACKUP_METHODS),
+        cache=fake_port(_CACHE_METHODS),
+        log=fake_port(_LOG_METHODS),
+        notification=fake_port(_RETENTION_NOTIFICATION_METHODS),
+        audit_log=fake_port(_RETENTION_AUDIT_LOG_METHODS)
+    )
+
+
+@pytest.fixture
+def _reset_retention_ports(retention_ports: RetentionPorts) -> None:
+    """Reset shared retention port fakes so each test starts from a clean state."""
+    retention_ports.reset()
+
+
+@pytest.fixture(scope="module")
+def now_utc() -> datetime:
+    """Fixed current time, so timestamp comparisons are deterministic."""
+    return datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def uuid_pool() -> List[str]:
+    """Pre-generated UUID strings for ids that only need to be unique."""
+    return [str(uuid4()) for _ in range(16)]
+
+
+@pytest.fixture(scope="session")
+def user_id() -> str:
+    """Valid user ID for testing."""
+    return "user_123"
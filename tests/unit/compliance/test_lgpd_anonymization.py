@@ -11,24 +11,24 @@ These tests ensure ValidaHub's anonymization techniques comply with LGPD standar
 and provide irreversible anonymization that maintains data utility for analytics.
 """
 
+import importlib.util
 import pytest
 from datetime import datetime, timedelta, timezone
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 from uuid import uuid4
 import hashlib
 import re
-from typing import Dict, List, Optional, Set, Any
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Any
 from enum import Enum
 
-# Note: These imports will fail initially (RED phase) - that's expected in TDD
-try:
-    from domain.compliance import (
-        AnonymizationTechnique,
-        AnonymizationResult, 
-        AnonymizedDataset,
-        KAnonymityLevel,
-        PersonalDataField
-    )
+# Compliance modules don't exist yet (RED phase in TDD); check for them without
+# importing so collection stays cheap, and skip the module until they land
+_HAS_COMPLIANCE = all(
+    importlib.util.find_spec(module) is not None
+    for module in ("application.compliance",)
+)
+if _HAS_COMPLIANCE:
     from application.compliance import (
         HashPersonalDataUseCase,
         MaskSensitiveDataUseCase,
@@ -37,14 +37,6 @@ try:
         ValidateKAnonymityUseCase,
         ApplyAnonymizationTechniqueUseCase
     )
-    from application.ports import (
-        AnonymizationPort,
-        DataAnalysisPort,
-        AuditLogPort
-    )
-except ImportError:
-    # Expected during RED phase
-    pass
 
 
 class AnonymizationTechniqueEnum(Enum):
@@ -70,161 +62,161 @@ class PersonalDataFieldEnum(Enum):
     FILE_NAME = "file_name"
 
 
-class TestLGPDAnonymization:
-    """Test LGPD Article 12 - Data Anonymization implementation."""
-    
-    @pytest.fixture
-    def mock_anonymization_port(self) -> Mock:
-        """Mock port for anonymization operations."""
-        return Mock(spec=[
-            'hash_field', 'mask_field', 'generalize_field', 'suppress_field',
-            'add_noise', 'validate_anonymization', 'check_re_identification_risk'
-        ])
-    
-    @pytest.fixture
-    def mock_data_analysis_port(self) -> Mock:
-        """Mock port for data analysis and validation."""
-        return Mock(spec=['calculate_k_anonymity', 'check_l_diversity', 'validate_t_closeness'])
-    
-    @pytest.fixture
-    def mock_audit_log_port(self) -> Mock:
-        """Mock port for anonymization audit logging."""
-        return Mock(spec=['log_anonymization_event'])
-    
-    @pytest.fixture
-    def sample_personal_data(self) -> List[Dict[str, Any]]:
-        """Sample personal data for anonymization testing."""
-        return [
-            {
-                "user_id": "user_001",
-                "name": "João Silva",
-                "email": "joao.silva@email.com",
-                "cpf": "123.456.789-00",
-                "birth_date": "1985-06-15",
-                "phone": "+55 11 99999-9999",
-                "address": "Rua A, 123, São Paulo, SP",
-                "ip_address": "192.168.1.100"
-            },
-            {
-                "user_id": "user_002", 
-                "name": "Maria Santos",
-                "email": "maria.santos@email.com",
-                "cpf": "987.654.321-00",
-                "birth_date": "1990-12-20",
-                "phone": "+55 11 88888-8888",
-                "address": "Rua B, 456, São Paulo, SP",
-                "ip_address": "192.168.1.101"
-            },
-            {
-                "user_id": "user_003",
-                "name": "Pedro Costa",
-                "email": "pedro.costa@email.com", 
-                "cpf": "555.666.777-88",
-                "birth_date": "1975-03-10",
-                "phone": "+55 11 77777-7777",
-                "address": "Rua C, 789, Rio de Janeiro, RJ",
-                "ip_address": "10.0.0.50"
-            }
-        ]
+# Plain string values of the enum members used by the tests
+_EMAIL = PersonalDataFieldEnum.EMAIL.value
+_CPF = PersonalDataFieldEnum.CPF.value
+_PHONE = PersonalDataFieldEnum.PHONE.value
+_BIRTH_DATE = PersonalDataFieldEnum.BIRTH_DATE.value
+_ADDRESS = PersonalDataFieldEnum.ADDRESS.value
+_USER_ID = PersonalDataFieldEnum.USER_ID.value
+_HASHING = AnonymizationTechniqueEnum.HASHING.value
+_MASKING = AnonymizationTechniqueEnum.MASKING.value
+_GENERALIZATION = AnonymizationTechniqueEnum.GENERALIZATION.value
+_SUPPRESSION = AnonymizationTechniqueEnum.SUPPRESSION.value
+_PSEUDONYMIZATION = AnonymizationTechniqueEnum.PSEUDONYMIZATION.value
+
+_ANONYMIZATION_SALT = "validahub_salt_2024_lgpd_compliance"
+
+# Keyed BLAKE2b state using the salt as key; _h() branches off it with .copy()
+# so the key block is never re-compressed. The production hashing port is
+# mocked, so tests only need a deterministic keyed hash, not SHA-256 itself.
+_SALTED = hashlib.blake2b(key=_ANONYMIZATION_SALT.encode(), digest_size=32)
+
+
+def _h(value: str) -> str:
+    """Salt-keyed BLAKE2b-256 hex digest of value."""
+    hasher = _SALTED.copy()
+    hasher.update(value.encode())
+    return hasher.hexdigest()
+
+
+# Expected salted email hashes, computed once per module instead of per test
+_HASHED_EMAILS = ("joao.silva@email.com", "joao@email.com", "maria@email.com")
+_EXPECTED_HASHES = {(email, _ANONYMIZATION_SALT): _h(email) for email in _HASHED_EMAILS}
+
+# Masked output formats; the mask alphabet is ASCII-only
+_CPF_MASK_RE = re.compile(r"^XXX\.XXX\.XXX-XX$", re.ASCII)
+_PHONE_MASK_RE = re.compile(r"^\+55 XX XXXXX-XXXX$", re.ASCII)
+
+_K_UNACHIEVABLE_RE = re.compile(r"K-anonymity cannot be achieved")
+
+
+@pytest.fixture(scope="module")
+def sample_personal_data() -> Sequence[Mapping[str, Any]]:
+    """Sample personal data for anonymization testing.
     
-    @pytest.fixture
-    def anonymization_salt(self) -> str:
-        """Salt for deterministic hashing."""
-        return "validahub_salt_2024_lgpd_compliance"
+    Shared across the module, so records are read-only mapping proxies.
+    """
+    return tuple(MappingProxyType(record) for record in [
+        {
+            "user_id": "user_001",
+            "name": "João Silva",
+            "email": "joao.silva@email.com",
+            "cpf": "123.456.789-00",
+            "birth_date": "1985-06-15",
+            "phone": "+55 11 99999-9999",
+            "address": "Rua A, 123, São Paulo, SP",
+            "ip_address": "192.168.1.100"
+        },
+        {
+            "user_id": "user_002", 
+            "name": "Maria Santos",
+            "email": "maria.santos@email.com",
+            "cpf": "987.654.321-00",
+            "birth_date": "1990-12-20",
+            "phone": "+55 11 88888-8888",
+            "address": "Rua B, 456, São Paulo, SP",
+            "ip_address": "192.168.1.101"
+        },
+        {
+            "user_id": "user_003",
+            "name": "Pedro Costa",
+            "email": "pedro.costa@email.com", 
+            "cpf": "555.666.777-88",
+            "birth_date": "1975-03-10",
+            "phone": "+55 11 77777-7777",
+            "address": "Rua C, 789, Rio de Janeiro, RJ",
+            "ip_address": "10.0.0.50"
+        }
+    ])
+
+
+@pytest.fixture(scope="module")
+def sample_personal_data_soa(
+    sample_personal_data: Sequence[Mapping[str, Any]]
+) -> Mapping[str, Sequence[str]]:
+    """Sample personal data laid out column-wise (one tuple per field)."""
+    return MappingProxyType({
+        field: tuple(record[field] for record in sample_personal_data)
+        for field in sample_personal_data[0]
+    })
+
+
+@pytest.fixture(scope="module")
+def anonymization_salt() -> str:
+    """Salt for deterministic hashing."""
+    return _ANONYMIZATION_SALT
+
+
+pytestmark = [
+    pytest.mark.skipif(
+        not _HAS_COMPLIANCE,
+        reason="LGPD compliance functionality not yet implemented"
+    ),
+    pytest.mark.compliance,
+    pytest.mark.usefixtures("_reset_ports"),
+]
+
+
+@pytest.fixture
+def mock_anonymization_port(ports) -> SimpleNamespace:
+    """Fake port for anonymization operations."""
+    return ports.anonymization
+
+
+@pytest.fixture
+def mock_data_analysis_port(ports) -> SimpleNamespace:
+    """Fake port for data analysis and validation."""
+    return ports.data_analysis
+
+
+@pytest.fixture
+def mock_audit_log_port(ports) -> SimpleNamespace:
+    """Fake port for anonymization audit logging."""
+    return ports.audit_log
 
 
 class TestHashEmailConsistently:
     """Test deterministic but irreversible email hashing."""
     
-    def test_hash_email_consistently__when_same_email_provided__returns_same_hash(
+    @pytest.mark.parametrize("emails,expect_equal", [
+        (("joao.silva@email.com", "joao.silva@email.com"), True),
+        (("joao@email.com", "maria@email.com"), False),
+    ], ids=["same_email", "different_emails"])
+    def test_hash_emails__returns_hash_equal_only_for_same_input(
         self,
-        mock_anonymization_port: Mock,
-        mock_audit_log_port: Mock,
+        emails: Sequence[str],
+        expect_equal: bool,
+        mock_anonymization_port: SimpleNamespace,
+        mock_audit_log_port: SimpleNamespace,
         anonymization_salt: str
     ):
         """
         LGPD Article 12: Anonymization must be consistent for analytical purposes.
         
-        When hashing emails, same email must always produce same hash
-        but must be irreversible (cannot recover original email).
-        """
-        # Arrange
-        email = "joao.silva@email.com"
-        expected_hash = hashlib.sha256(f"{email}{anonymization_salt}".encode()).hexdigest()
-        
-        mock_anonymization_port.hash_field.return_value = {
-            "original_value": email,
-            "anonymized_value": f"hash_{expected_hash[:16]}",  # Truncated hash for readability
-            "technique": AnonymizationTechniqueEnum.HASHING.value,
-            "irreversible": True,
-            "deterministic": True
-        }
-        
-        use_case = HashPersonalDataUseCase(
-            anonymization_port=mock_anonymization_port,
-            audit_log_port=mock_audit_log_port
-        )
-        
-        # Act - Hash same email multiple times
-        result1 = use_case.execute(
-            field_type=PersonalDataFieldEnum.EMAIL.value,
-            value=email,
-            salt=anonymization_salt
-        )
-        
-        result2 = use_case.execute(
-            field_type=PersonalDataFieldEnum.EMAIL.value,
-            value=email,
-            salt=anonymization_salt
-        )
-        
-        # Assert
-        assert result1.anonymized_value == result2.anonymized_value  # Consistency
-        assert result1.irreversible is True  # Cannot recover original
-        assert result1.deterministic is True  # Same input = same output
-        assert result1.anonymized_value != email  # Actually anonymized
-        assert result1.anonymized_value.startswith("hash_")  # Proper format
-        
-        # Verify hashing was applied correctly
-        mock_anonymization_port.hash_field.assert_called()
-        hash_calls = mock_anonymization_port.hash_field.call_args_list
-        assert len(hash_calls) == 2  # Called twice
-        assert hash_calls[0] == hash_calls[1]  # Same parameters
-        
-        # Verify hashing was audited
-        assert mock_audit_log_port.log_anonymization_event.call_count == 2
-        audit_call = mock_audit_log_port.log_anonymization_event.call_args[1]
-        assert audit_call["technique"] == AnonymizationTechniqueEnum.HASHING.value
-        assert audit_call["field_type"] == PersonalDataFieldEnum.EMAIL.value
-        assert audit_call["irreversible"] is True
-    
-    def test_hash_different_emails__when_different_inputs__returns_different_hashes(
-        self,
-        mock_anonymization_port: Mock,
-        mock_audit_log_port: Mock,
-        anonymization_salt: str
-    ):
-        """
-        Different emails must produce different hashes to maintain data utility.
+        Same email must always produce the same hash and different emails must
+        produce different hashes, while remaining irreversible.
         """
         # Arrange
-        email1 = "joao@email.com"
-        email2 = "maria@email.com"
-        
-        hash1 = hashlib.sha256(f"{email1}{anonymization_salt}".encode()).hexdigest()
-        hash2 = hashlib.sha256(f"{email2}{anonymization_salt}".encode()).hexdigest()
-        
         mock_anonymization_port.hash_field.side_effect = [
             {
-                "anonymized_value": f"hash_{hash1[:16]}",
-                "irreversible": True,
-                "deterministic": True
-            },
-            {
-                "anonymized_value": f"hash_{hash2[:16]}",
+                "original_value": email,
+                "anonymized_value": f"hash_{_EXPECTED_HASHES[(email, anonymization_salt)][:16]}",
+                "technique": _HASHING,
                 "irreversible": True,
                 "deterministic": True
             }
+            for email in emails
         ]
         
         use_case = HashPersonalDataUseCase(
@@ -233,19 +225,39 @@ class TestHashEmailConsistently:
         )
         
         # Act
-        result1 = use_case.execute(PersonalDataFieldEnum.EMAIL.value, email1, anonymization_salt)
-        result2 = use_case.execute(PersonalDataFieldEnum.EMAIL.value, email2, anonymization_salt)
+        results = [
+            use_case.execute(
+                field_type=_EMAIL,
+                value=email,
+                salt=anonymization_salt
+            )
+            for email in emails
+        ]
         
         # Assert
-        assert result1.anonymized_value != result2.anonymized_value  # Different outputs
-        assert result1.anonymized_value != email1  # Anonymized
-        assert result2.anonymized_value != email2  # Anonymized
-        assert both_results_irreversible(result1, result2)
+        assert (results[0].anonymized_value == results[1].anonymized_value) is expect_equal
+        for email, result in zip(emails, results, strict=True):
+            assert result.anonymized_value != email  # Actually anonymized
+            assert result.anonymized_value.startswith("hash_")  # Proper format
+            assert result.irreversible is True  # Cannot recover original
+            assert result.deterministic is True  # Same input = same output
+        
+        # Verify hashing was applied once per input
+        hash_calls = mock_anonymization_port.hash_field.call_args_list
+        assert len(hash_calls) == len(emails)
+        assert (hash_calls[0] == hash_calls[1]) is expect_equal
+        
+        # Verify hashing was audited
+        assert mock_audit_log_port.log_anonymization_event.call_count == len(emails)
+        audit_call = mock_audit_log_port.log_anonymization_event.call_args[1]
+        assert audit_call["technique"] == _HASHING
+        assert audit_call["field_type"] == _EMAIL
+        assert audit_call["irreversible"] is True
     
     def test_hash_email__when_salt_missing__raises_anonymization_error(
         self,
-        mock_anonymization_port: Mock,
-        mock_audit_log_port: Mock
+        mock_anonymization_port: SimpleNamespace,
+        mock_audit_log_port: SimpleNamespace
     ):
         """
         Hashing without salt creates security vulnerability and must be rejected.
@@ -259,7 +271,7 @@ class TestHashEmailConsistently:
         # Act & Assert
         with pytest.raises(ValueError, match="Salt required for secure hashing"):
             use_case.execute(
-                field_type=PersonalDataFieldEnum.EMAIL.value,
+                field_type=_EMAIL,
                 value="test@email.com",
                 salt=""  # Empty salt not allowed
             )
@@ -270,8 +282,8 @@ class TestMaskCPFFormatPreserved:
     
     def test_mask_cpf_format_preserved__when_cpf_provided__returns_masked_cpf_with_format(
         self,
-        mock_anonymization_port: Mock,
-        mock_audit_log_port: Mock
+        mock_anonymization_port: SimpleNamespace,
+        mock_audit_log_port: SimpleNamespace
     ):
         """
         LGPD Article 12: Masking must preserve data utility while anonymizing.
@@ -286,7 +298,7 @@ class TestMaskCPFFormatPreserved:
         mock_anonymization_port.mask_field.return_value = {
             "original_value": cpf,
             "anonymized_value": masked_cpf,
-            "technique": AnonymizationTechniqueEnum.MASKING.value,
+            "technique": _MASKING,
             "format_preserved": True,
             "data_type_preserved": True
         }
@@ -298,7 +310,7 @@ class TestMaskCPFFormatPreserved:
         
         # Act
         result = use_case.execute(
-            field_type=PersonalDataFieldEnum.CPF.value,
+            field_type=_CPF,
             value=cpf,
             mask_pattern="XXX.XXX.XXX-XX"
         )
@@ -312,26 +324,26 @@ class TestMaskCPFFormatPreserved:
         assert result.anonymized_value.count('-') == cpf.count('-')  # Same dash
         
         # Verify CPF pattern is maintained
-        cpf_pattern = r'^XXX\.XXX\.XXX-XX$'
-        assert re.match(cpf_pattern, result.anonymized_value)
+        assert _CPF_MASK_RE.match(result.anonymized_value)
         
         # Verify masking was applied correctly
-        mock_anonymization_port.mask_field.assert_called_once_with(
-            field_type=PersonalDataFieldEnum.CPF.value,
-            value=cpf,
-            mask_pattern="XXX.XXX.XXX-XX"
-        )
+        assert mock_anonymization_port.mask_field.call_count == 1
+        assert mock_anonymization_port.mask_field.call_args.kwargs == {
+            "field_type": _CPF,
+            "value": cpf,
+            "mask_pattern": "XXX.XXX.XXX-XX"
+        }
         
         # Verify masking was audited
         mock_audit_log_port.log_anonymization_event.assert_called_once()
         audit_call = mock_audit_log_port.log_anonymization_event.call_args[1]
-        assert audit_call["technique"] == AnonymizationTechniqueEnum.MASKING.value
+        assert audit_call["technique"] == _MASKING
         assert audit_call["format_preserved"] is True
     
     def test_mask_phone_format_preserved__when_phone_provided__returns_masked_phone_with_format(
         self,
-        mock_anonymization_port: Mock,
-        mock_audit_log_port: Mock
+        mock_anonymization_port: SimpleNamespace,
+        mock_audit_log_port: SimpleNamespace
     ):
         """
         Phone numbers must be masked while preserving Brazilian phone format.
@@ -343,7 +355,7 @@ class TestMaskCPFFormatPreserved:
         mock_anonymization_port.mask_field.return_value = {
             "original_value": phone,
             "anonymized_value": masked_phone,
-            "technique": AnonymizationTechniqueEnum.MASKING.value,
+            "technique": _MASKING,
             "format_preserved": True,
             "country_code_preserved": True
         }
@@ -355,13 +367,14 @@ class TestMaskCPFFormatPreserved:
         
         # Act
         result = use_case.execute(
-            field_type=PersonalDataFieldEnum.PHONE.value,
+            field_type=_PHONE,
             value=phone,
             mask_pattern="+55 XX XXXXX-XXXX"
         )
         
         # Assert
         assert result.anonymized_value == "+55 XX XXXXX-XXXX"
+        assert _PHONE_MASK_RE.match(result.anonymized_value)
         assert result.anonymized_value.startswith("+55")  # Country code preserved
         assert len(result.anonymized_value) == len(phone)  # Same length
 
@@ -371,8 +384,8 @@ class TestPseudonymizeUserId:
     
     def test_pseudonymize_user_id__when_user_id_provided__returns_consistent_pseudonym(
         self,
-        mock_anonymization_port: Mock,
-        mock_audit_log_port: Mock,
+        mock_anonymization_port: SimpleNamespace,
+        mock_audit_log_port: SimpleNamespace,
         anonymization_salt: str
     ):
         """
@@ -385,16 +398,15 @@ class TestPseudonymizeUserId:
         """
         # Arrange
         user_id = "user_123"
-        # Generate deterministic pseudonym based on original ID + salt
-        pseudonym_source = f"{user_id}_{anonymization_salt}"
-        pseudonym_hash = hashlib.sha256(pseudonym_source.encode()).hexdigest()
+        # Generate deterministic pseudonym keyed by the salt
+        pseudonym_hash = _h(user_id)
         # Create UUID-like pseudonym from hash
         pseudonym = f"pseudo-{pseudonym_hash[:8]}-{pseudonym_hash[8:12]}-{pseudonym_hash[12:16]}-{pseudonym_hash[16:20]}"
         
         mock_anonymization_port.pseudonymize_field.return_value = {
             "original_value": user_id,
             "anonymized_value": pseudonym,
-            "technique": AnonymizationTechniqueEnum.PSEUDONYMIZATION.value,
+            "technique": _PSEUDONYMIZATION,
             "consistent": True,
             "reversible": False,
             "format_valid": True
@@ -407,9 +419,9 @@ class TestPseudonymizeUserId:
         
         # Act
         result = use_case.execute(
-            field_type=PersonalDataFieldEnum.USER_ID.value,
+            field_type=_USER_ID,
             value=user_id,
-            technique=AnonymizationTechniqueEnum.PSEUDONYMIZATION.value,
+            technique=_PSEUDONYMIZATION,
             parameters={"salt": anonymization_salt}
         )
         
@@ -426,7 +438,7 @@ class TestPseudonymizeUserId:
         # Verify pseudonymization was audited
         mock_audit_log_port.log_anonymization_event.assert_called_once()
         audit_call = mock_audit_log_port.log_anonymization_event.call_args[1]
-        assert audit_call["technique"] == AnonymizationTechniqueEnum.PSEUDONYMIZATION.value
+        assert audit_call["technique"] == _PSEUDONYMIZATION
         assert audit_call["consistent"] is True
         assert audit_call["reversible"] is False
 
@@ -436,8 +448,8 @@ class TestGeneralizeBirthDateToYear:
     
     def test_generalize_birth_date_to_year__when_birth_date_provided__returns_year_only(
         self,
-        mock_anonymization_port: Mock,
-        mock_audit_log_port: Mock
+        mock_anonymization_port: SimpleNamespace,
+        mock_audit_log_port: SimpleNamespace
     ):
         """
         LGPD Article 12: Generalization reduces granularity while preserving utility.
@@ -454,7 +466,7 @@ class TestGeneralizeBirthDateToYear:
         mock_anonymization_port.generalize_field.return_value = {
             "original_value": birth_date,
             "anonymized_value": generalized_year,
-            "technique": AnonymizationTechniqueEnum.GENERALIZATION.value,
+            "technique": _GENERALIZATION,
             "granularity_reduced": True,
             "utility_preserved": True,
             "precision_loss": "day_and_month_removed"
@@ -467,7 +479,7 @@ class TestGeneralizeBirthDateToYear:
         
         # Act
         result = use_case.execute(
-            field_type=PersonalDataFieldEnum.BIRTH_DATE.value,
+            field_type=_BIRTH_DATE,
             value=birth_date,
             generalization_level="year_only"
         )
@@ -485,22 +497,23 @@ class TestGeneralizeBirthDateToYear:
         assert original_year == anonymized_year  # Year preserved
         
         # Verify generalization was applied
-        mock_anonymization_port.generalize_field.assert_called_once_with(
-            field_type=PersonalDataFieldEnum.BIRTH_DATE.value,
-            value=birth_date,
-            generalization_level="year_only"
-        )
+        assert mock_anonymization_port.generalize_field.call_count == 1
+        assert mock_anonymization_port.generalize_field.call_args.kwargs == {
+            "field_type": _BIRTH_DATE,
+            "value": birth_date,
+            "generalization_level": "year_only"
+        }
         
         # Verify generalization was audited
         mock_audit_log_port.log_anonymization_event.assert_called_once()
         audit_call = mock_audit_log_port.log_anonymization_event.call_args[1]
-        assert audit_call["technique"] == AnonymizationTechniqueEnum.GENERALIZATION.value
+        assert audit_call["technique"] == _GENERALIZATION
         assert audit_call["granularity_reduced"] is True
     
     def test_generalize_address_to_city__when_full_address_provided__returns_city_only(
         self,
-        mock_anonymization_port: Mock,
-        mock_audit_log_port: Mock
+        mock_anonymization_port: SimpleNamespace,
+        mock_audit_log_port: SimpleNamespace
     ):
         """
         Full addresses must be generalized to city level for location analysis.
@@ -512,7 +525,7 @@ class TestGeneralizeBirthDateToYear:
         mock_anonymization_port.generalize_field.return_value = {
             "original_value": full_address,
             "anonymized_value": generalized_city,
-            "technique": AnonymizationTechniqueEnum.GENERALIZATION.value,
+            "technique": _GENERALIZATION,
             "granularity_reduced": True,
             "utility_preserved": True,
             "precision_loss": "street_and_number_removed"
@@ -525,7 +538,7 @@ class TestGeneralizeBirthDateToYear:
         
         # Act
         result = use_case.execute(
-            field_type=PersonalDataFieldEnum.ADDRESS.value,
+            field_type=_ADDRESS,
             value=full_address,
             generalization_level="city_state"
         )
@@ -544,10 +557,11 @@ class TestSuppressRareAttributes:
     
     def test_suppress_rare_attributes__when_unique_identifiers_found__removes_identifying_fields(
         self,
-        mock_anonymization_port: Mock,
-        mock_data_analysis_port: Mock,
-        mock_audit_log_port: Mock,
-        sample_personal_data: List[Dict[str, Any]]
+        mock_anonymization_port: SimpleNamespace,
+        mock_data_analysis_port: SimpleNamespace,
+        mock_audit_log_port: SimpleNamespace,
+        sample_personal_data: Sequence[Mapping[str, Any]],
+        sample_personal_data_soa: Mapping[str, Sequence[str]]
     ):
         """
         LGPD Article 12: Unique attributes that could re-identify individuals must be suppressed.
@@ -571,19 +585,29 @@ class TestSuppressRareAttributes:
         
         mock_data_analysis_port.analyze_uniqueness.return_value = rare_attributes_analysis
         
+        # Build the expected anonymized records column-wise from the sample data
+        hashed_names = [_h(name) for name in sample_personal_data_soa["name"]]
+        hashed_emails = [_h(email) for email in sample_personal_data_soa["email"]]
         suppressed_data = [
             {
-                "user_id": "pseudo-abc123-def4-5678-9012",
-                "name": "hash_a1b2c3d4",
-                "email": "hash_e5f6g7h8", 
+                "user_id": f"pseudo-{user_id}",
+                "name": f"hash_{name_hash[:8]}",
+                "email": f"hash_{email_hash[:8]}",
                 "cpf": "XXX.XXX.XXX-XX",
-                "birth_date": "1985",  # Generalized
+                "birth_date": birth_date[:4],  # Generalized
                 "phone": "+55 XX XXXXX-XXXX",
-                "address": "São Paulo, SP",  # Generalized
+                "address": address.split(", ", 2)[-1],  # Generalized
                 # ip_address: SUPPRESSED (unique identifier)
                 # file_name: SUPPRESSED (unique identifier)
-            },
-            # Similar for other records...
+            }
+            for user_id, name_hash, email_hash, birth_date, address in zip(
+                sample_personal_data_soa["user_id"],
+                hashed_names,
+                hashed_emails,
+                sample_personal_data_soa["birth_date"],
+                sample_personal_data_soa["address"],
+                strict=True
+            )
         ]
         
         mock_anonymization_port.suppress_field.return_value = {
@@ -620,10 +644,11 @@ class TestSuppressRareAttributes:
             assert "birth_date" in record  # Generalized but kept
         
         # Verify uniqueness analysis was performed
-        mock_data_analysis_port.analyze_uniqueness.assert_called_once_with(
-            dataset=sample_personal_data,
-            uniqueness_threshold=0.9
-        )
+        assert mock_data_analysis_port.analyze_uniqueness.call_count == 1
+        assert mock_data_analysis_port.analyze_uniqueness.call_args.kwargs == {
+            "dataset": sample_personal_data,
+            "uniqueness_threshold": 0.9
+        }
         
         # Verify suppression was applied
         mock_anonymization_port.suppress_field.assert_called_once()
@@ -631,20 +656,58 @@ class TestSuppressRareAttributes:
         # Verify suppression was audited
         mock_audit_log_port.log_anonymization_event.assert_called_once()
         audit_call = mock_audit_log_port.log_anonymization_event.call_args[1]
-        assert audit_call["technique"] == AnonymizationTechniqueEnum.SUPPRESSION.value
+        assert audit_call["technique"] == _SUPPRESSION
         assert audit_call["suppressed_fields"] == ["ip_address", "file_name"]
         assert audit_call["re_identification_risk_reduced"] is True
 
 
+# Initial analysis shows k-anonymity violations; frozen so the class-scoped use
+# case can't leak changes between tests
+_INITIAL_K_ANALYSIS = MappingProxyType({
+    "current_k_level": 1,  # Each record is unique - violates k-anonymity
+    "violations": (
+        MappingProxyType({
+            "record_group": ("user_001",),
+            "quasi_identifier_values": MappingProxyType({"birth_date": "1985-06-15", "address": "São Paulo", "phone": "+55 11 99999-9999"}),
+            "group_size": 1  # Only 1 record with these values = k=1
+        }),
+        MappingProxyType({
+            "record_group": ("user_002",),
+            "quasi_identifier_values": MappingProxyType({"birth_date": "1990-12-20", "address": "São Paulo", "phone": "+55 11 88888-8888"}),
+            "group_size": 1
+        })
+    )
+})
+
+# After anonymization, k-anonymity is satisfied
+_FINAL_K_ANALYSIS = MappingProxyType({
+    "current_k_level": 5,  # Meets minimum requirement
+    "violations": (),  # No violations
+    "anonymization_successful": True,
+    "techniques_applied": (
+        _GENERALIZATION,  # Birth dates generalized to year
+        _SUPPRESSION      # Unique phone numbers suppressed
+    )
+})
+
+
 class TestKAnonymityValidation:
     """Test k-anonymity validation for datasets."""
     
+    @pytest.fixture(scope="class")
+    def use_case(self, ports):
+        """K-anonymity use case wired once per class; ports are reset per test."""
+        return ValidateKAnonymityUseCase(
+            anonymization_port=ports.anonymization,
+            data_analysis_port=ports.data_analysis,
+            audit_log_port=ports.audit_log
+        )
+    
     def test_validate_k_anonymity__when_dataset_provided__ensures_minimum_k_level(
         self,
-        mock_anonymization_port: Mock,
-        mock_data_analysis_port: Mock,
-        mock_audit_log_port: Mock,
-        sample_personal_data: List[Dict[str, Any]]
+        use_case,
+        ports,
+        sample_personal_data: Sequence[Mapping[str, Any]]
     ):
         """
         LGPD Article 12: Anonymization must prevent re-identification.
@@ -656,66 +719,30 @@ class TestKAnonymityValidation:
         quasi_identifiers = ["birth_date", "address", "phone"]  # Attributes that could identify someone
         target_k = 5  # Each record must be identical to at least 4 others on these attributes
         
-        # Initial analysis shows k-anonymity violations
-        initial_k_analysis = {
-            "current_k_level": 1,  # Each record is unique - violates k-anonymity
-            "violations": [
-                {
-                    "record_group": ["user_001"],
-                    "quasi_identifier_values": {"birth_date": "1985-06-15", "address": "São Paulo", "phone": "+55 11 99999-9999"},
-                    "group_size": 1  # Only 1 record with these values = k=1
-                },
-                {
-                    "record_group": ["user_002"], 
-                    "quasi_identifier_values": {"birth_date": "1990-12-20", "address": "São Paulo", "phone": "+55 11 88888-8888"},
-                    "group_size": 1
-                }
-            ]
-        }
-        
-        # After anonymization, k-anonymity is satisfied
-        final_k_analysis = {
-            "current_k_level": 5,  # Meets minimum requirement
-            "violations": [],  # No violations
-            "anonymization_successful": True,
-            "techniques_applied": [
-                AnonymizationTechniqueEnum.GENERALIZATION.value,  # Birth dates generalized to year
-                AnonymizationTechniqueEnum.SUPPRESSION.value      # Unique phone numbers suppressed
-            ]
-        }
-        
-        mock_data_analysis_port.calculate_k_anonymity.side_effect = [
-            initial_k_analysis,  # Before anonymization
-            final_k_analysis     # After anonymization
+        ports.data_analysis.calculate_k_anonymity.side_effect = [
+            _INITIAL_K_ANALYSIS,  # Before anonymization
+            _FINAL_K_ANALYSIS     # After anonymization
         ]
         
         # Mock anonymization to achieve k-anonymity
-        anonymized_dataset = [
-            {
-                "user_id": "pseudo-abc123", "name": "hash_a1b2", "email": "hash_e5f6",
-                "cpf": "XXX.XXX.XXX-XX", "birth_date": "1985", "address": "São Paulo, SP"
-                # phone suppressed to achieve k-anonymity
-            },
-            {
-                "user_id": "pseudo-def456", "name": "hash_c3d4", "email": "hash_g7h8", 
-                "cpf": "XXX.XXX.XXX-XX", "birth_date": "1990", "address": "São Paulo, SP"
-                # phone suppressed, birth_date generalized
-            },
-            # Additional records with same generalized values to achieve k=5...
-        ]
-        
-        mock_anonymization_port.apply_k_anonymity.return_value = {
-            "anonymized_dataset": anonymized_dataset,
+        ports.anonymization.apply_k_anonymity.return_value = {
+            "anonymized_dataset": [
+                {
+                    "user_id": "pseudo-abc123", "name": "hash_a1b2", "email": "hash_e5f6",
+                    "cpf": "XXX.XXX.XXX-XX", "birth_date": "1985", "address": "São Paulo, SP"
+                    # phone suppressed to achieve k-anonymity
+                },
+                {
+                    "user_id": "pseudo-def456", "name": "hash_c3d4", "email": "hash_g7h8",
+                    "cpf": "XXX.XXX.XXX-XX", "birth_date": "1990", "address": "São Paulo, SP"
+                    # phone suppressed, birth_date generalized
+                },
+                # Additional records with same generalized values to achieve k=5...
+            ],
             "k_level_achieved": 5,
-            "techniques_used": [AnonymizationTechniqueEnum.GENERALIZATION.value, AnonymizationTechniqueEnum.SUPPRESSION.value]
+            "techniques_used": [_GENERALIZATION, _SUPPRESSION]
         }
         
-        use_case = ValidateKAnonymityUseCase(
-            anonymization_port=mock_anonymization_port,
-            data_analysis_port=mock_data_analysis_port,
-            audit_log_port=mock_audit_log_port
-        )
-        
         # Act
         result = use_case.execute(
             dataset=sample_personal_data,
@@ -730,65 +757,63 @@ class TestKAnonymityValidation:
         assert len(result.anonymized_dataset) == len(sample_personal_data)  # No records lost
         
         # Verify k-anonymity was calculated before and after
-        assert mock_data_analysis_port.calculate_k_anonymity.call_count == 2
+        assert ports.data_analysis.calculate_k_anonymity.call_count == 2
         
         # Verify anonymization was applied to achieve k-anonymity
-        mock_anonymization_port.apply_k_anonymity.assert_called_once_with(
-            dataset=sample_personal_data,
-            quasi_identifiers=quasi_identifiers,
-            target_k_level=target_k
-        )
+        assert ports.anonymization.apply_k_anonymity.call_count == 1
+        assert ports.anonymization.apply_k_anonymity.call_args.kwargs == {
+            "dataset": sample_personal_data,
+            "quasi_identifiers": quasi_identifiers,
+            "target_k_level": target_k
+        }
         
-        # Verify k-anonymity validation was audited
-        mock_audit_log_port.log_anonymization_event.assert_called_once()
-        audit_call = mock_audit_log_port.log_anonymization_event.call_args[1]
-        assert audit_call["technique"] == "k_anonymity_validation"
-        assert audit_call["target_k_level"] == target_k
-        assert audit_call["achieved_k_level"] == 5
-        assert audit_call["k_anonymity_satisfied"] is True
+        # Verify k-anonymity validation was audited; the payload may carry further fields
+        ports.audit_log.log_anonymization_event.assert_called_once()
+        audit_call = ports.audit_log.log_anonymization_event.call_args.kwargs
+        assert audit_call.items() >= {
+            "technique": "k_anonymity_validation",
+            "target_k_level": target_k,
+            "achieved_k_level": 5,
+            "k_anonymity_satisfied": True
+        }.items()
     
+    @pytest.mark.parametrize("dataset,quasi_identifiers,max_possible_k", [
+        ([{"user_id": "user_001", "name": "João"}], ["name"], 1),  # Only 1 record
+        ([{"user_id": f"user_00{i}", "address": "São Paulo"} for i in range(1, 5)], ["address"], 4),  # 4 < k
+    ], ids=["single_record", "fewer_records_than_k"])
     def test_validate_k_anonymity__when_k_cannot_be_achieved__raises_anonymization_error(
         self,
-        mock_anonymization_port: Mock,
-        mock_data_analysis_port: Mock,
-        mock_audit_log_port: Mock
+        use_case,
+        ports,
+        dataset: List[Dict[str, Any]],
+        quasi_identifiers: List[str],
+        max_possible_k: int
     ):
         """
         If k-anonymity cannot be achieved, anonymization must fail rather than provide false security.
         """
         # Arrange
-        dataset_too_small = [{"user_id": "user_001", "name": "João"}]  # Only 1 record
-        target_k = 5  # Impossible with 1 record
+        target_k = 5  # Impossible with fewer than 5 records
         
-        mock_data_analysis_port.calculate_k_anonymity.return_value = {
+        ports.data_analysis.calculate_k_anonymity.return_value = {
             "current_k_level": 1,
-            "max_possible_k": 1,  # Dataset too small
+            "max_possible_k": max_possible_k,  # Dataset too small
             "violations": [{"group_size": 1}]
         }
         
-        use_case = ValidateKAnonymityUseCase(
-            anonymization_port=mock_anonymization_port,
-            data_analysis_port=mock_data_analysis_port,
-            audit_log_port=mock_audit_log_port
-        )
-        
         # Act & Assert
-        with pytest.raises(ValueError, match="K-anonymity cannot be achieved"):
+        with pytest.raises(ValueError, match=_K_UNACHIEVABLE_RE):
             use_case.execute(
-                dataset=dataset_too_small,
-                quasi_identifiers=["name"],
+                dataset=dataset,
+                quasi_identifiers=quasi_identifiers,
                 target_k_level=target_k
             )
         
-        # Verify failure was audited
-        mock_audit_log_port.log_anonymization_event.assert_called_once()
-        audit_call = mock_audit_log_port.log_anonymization_event.call_args[1]
-        assert audit_call["technique"] == "k_anonymity_validation"
-        assert audit_call["k_anonymity_satisfied"] is False
-        assert audit_call["failure_reason"] == "dataset_too_small"
-
-
-# Helper functions
-def both_results_irreversible(result1, result2) -> bool:
-    """Helper to check if both results are irreversible."""
-    return result1.irreversible is True and result2.irreversible is True
\ No newline at end of file
+        # Verify failure was audited; the payload may carry further fields
+        ports.audit_log.log_anonymization_event.assert_called_once()
+        audit_call = ports.audit_log.log_anonymization_event.call_args.kwargs
+        assert audit_call.items() >= {
+            "technique": "k_anonymity_validation",
+            "k_anonymity_satisfied": False,
+            "failure_reason": "dataset_too_small"
+        }.items()
@@ -13,17 +13,27 @@ These tests ensure ValidaHub's audit logging system complies with LGPD requireme
 for accountability and demonstrable compliance.
 """
 
+import importlib.util
 import pytest
-from datetime import datetime, timedelta, timezone
-from unittest.mock import Mock, patch
+from datetime import datetime, timedelta
+from unittest.mock import patch
 from uuid import uuid4
+import dataclasses
 import json
 import hashlib
-from typing import Dict, List, Optional, Set, Any
+import re
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Iterator, List, Optional, Set, Any
 from enum import Enum
 
-# Note: These imports will fail initially (RED phase) - that's expected in TDD
-try:
+
+# Compliance modules don't exist yet (RED phase in TDD); check for them without
+# importing so collection stays cheap, and skip the module until they land
+_HAS_COMPLIANCE = all(
+    importlib.util.find_spec(module) is not None
+    for module in ("domain.compliance", "application.compliance", "application.ports")
+)
+if _HAS_COMPLIANCE:
     from domain.compliance import (
         AuditLogEntry,
         AuditEventType, 
@@ -44,9 +54,6 @@ try:
         EncryptionPort,
         NotificationPort
     )
-except ImportError:
-    # Expected during RED phase
-    pass
 
 
 class AuditEventTypeEnum(Enum):
@@ -65,41 +72,107 @@ class AuditEventTypeEnum(Enum):
     DATA_BREACH = "data_breach"  # Personal data breach detected
 
 
-class TestLGPDAuditLogging:
-    """Test LGPD Article 37 - Audit Logging implementation."""
-    
-    @pytest.fixture
-    def mock_audit_log_repo(self) -> Mock:
-        """Mock repository for audit log operations."""
-        return Mock(spec=[
-            'save_log_entry', 'query_logs', 'get_log_by_id', 
-            'verify_log_integrity', 'get_logs_by_date_range'
-        ])
-    
-    @pytest.fixture
-    def mock_immutable_storage_port(self) -> Mock:
-        """Mock port for immutable storage operations."""
-        return Mock(spec=['store_immutable_record', 'verify_record_integrity', 'get_record_hash'])
-    
-    @pytest.fixture
-    def mock_encryption_port(self) -> Mock:
-        """Mock port for encryption operations."""
-        return Mock(spec=['encrypt_sensitive_data', 'hash_personal_identifiers'])
-    
-    @pytest.fixture 
-    def mock_notification_port(self) -> Mock:
-        """Mock port for audit-related notifications."""
-        return Mock(spec=['notify_audit_anomaly', 'notify_compliance_officer'])
-    
-    @pytest.fixture
-    def request_id(self) -> str:
-        """Valid request ID for correlation."""
-        return str(uuid4())
-    
-    @pytest.fixture
-    def actor_id(self) -> str:
-        """Valid actor ID (anonymized)."""
-        return "actor_hash_abc123"
+# Regulatory audit log retention, independent of personal data retention
+_AUDIT_RETENTION_YEARS = 7
+_AUDIT_RETENTION_DELTA = timedelta(days=365 * _AUDIT_RETENTION_YEARS)
+
+# Per-category compliance summary returned by the mocked report; read-only and shared
+_COMPREHENSIVE_AUDIT_DATA = tuple(MappingProxyType(summary) for summary in [
+    # Data subject rights exercises
+    {
+        "event_category": "data_subject_rights",
+        "total_requests": 156,
+        "export_requests": 89,
+        "deletion_requests": 45,
+        "correction_requests": 22,
+        "average_response_time_hours": 18.5,
+        "legal_compliance_rate": 100.0
+    },
+    # Consent management
+    {
+        "event_category": "consent_management", 
+        "consents_given": 1247,
+        "consents_withdrawn": 89,
+        "consent_updates": 203,
+        "processing_stopped_on_withdrawal": 89,
+        "consent_compliance_rate": 100.0
+    },
+    # Data retention
+    {
+        "event_category": "data_retention",
+        "retention_policies_applied": 45,
+        "automatic_deletions": 234,
+        "manual_deletions": 45,
+        "retention_compliance_rate": 98.7,
+        "overdue_deletions": 3
+    }
+])
+
+# Personal data values that must never reach a saved audit entry
+_PERSONAL_DATA_RE = re.compile("|".join(map(re.escape, (
+    "João Silva", "joao.silva@email.com", "123.456.789-00", "192.168.1.100"
+))))
+
+
+def _leaves(obj: Any) -> Iterator[Any]:
+    """Yield the primitive values (and mapping keys) nested inside obj."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        for f in dataclasses.fields(obj):
+            yield from _leaves(getattr(obj, f.name))
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            yield key
+            yield from _leaves(value)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            yield from _leaves(item)
+    else:
+        yield obj
+
+
+pytestmark = [
+    pytest.mark.skipif(
+        not _HAS_COMPLIANCE,
+        reason="LGPD compliance functionality not yet implemented"
+    ),
+    pytest.mark.usefixtures("_reset_audit_ports"),
+]
+
+
+@pytest.fixture
+def mock_audit_log_repo(audit_ports) -> SimpleNamespace:
+    """Fake repository for audit log operations."""
+    return audit_ports.audit_log_repo
+
+
+@pytest.fixture
+def mock_immutable_storage_port(audit_ports) -> SimpleNamespace:
+    """Fake port for immutable storage operations."""
+    return audit_ports.immutable_storage
+
+
+@pytest.fixture
+def mock_encryption_port(audit_ports) -> SimpleNamespace:
+    """Fake port for encryption operations."""
+    return audit_ports.encryption
+
+
+@pytest.fixture
+def mock_notification_port(audit_ports) -> SimpleNamespace:
+    """Fake port for audit-related notifications."""
+    return audit_ports.notification
+
+
+@pytest.fixture
+def request_id() -> str:
+    """Valid request ID for correlation."""
+    return str(uuid4())
+
+
+@pytest.fixture
+def actor_id() -> str:
+    """Valid actor ID (anonymized)."""
+    return "actor_hash_abc123"
 
 
 class TestLogAllPersonalDataAccess:
@@ -107,12 +180,13 @@ class TestLogAllPersonalDataAccess:
     
     def test_log_personal_data_access__when_data_accessed__creates_complete_audit_record(
         self,
-        mock_audit_log_repo: Mock,
-        mock_immutable_storage_port: Mock,
-        mock_encryption_port: Mock,
+        mock_audit_log_repo: SimpleNamespace,
+        mock_immutable_storage_port: SimpleNamespace,
+        mock_encryption_port: SimpleNamespace,
         tenant_id: str,
         request_id: str,
-        actor_id: str
+        actor_id: str,
+        now_utc: datetime
     ):
         """
         LGPD Article 37: All personal data access must be logged for accountability.
@@ -139,7 +213,7 @@ class TestLogAllPersonalDataAccess:
             request_id=request_id,
             event_type=AuditEventTypeEnum.DATA_ACCESS.value,
             actor_id=actor_id,  # Who
-            timestamp=datetime.now(timezone.utc),  # When
+            timestamp=now_utc,  # When
             data_subject_id=access_details["data_subject_id"],  # Whose data
             activity_description="Personal data accessed for user export request",  # What
             legal_basis=access_details["legal_basis"],  # Why
@@ -216,12 +290,13 @@ class TestLogAllPersonalDataAccess:
     
     def test_log_data_processing_activity__when_job_processed__creates_processing_audit_trail(
         self,
-        mock_audit_log_repo: Mock,
-        mock_immutable_storage_port: Mock,
-        mock_encryption_port: Mock,
+        mock_audit_log_repo: SimpleNamespace,
+        mock_immutable_storage_port: SimpleNamespace,
+        mock_encryption_port: SimpleNamespace,
         tenant_id: str,
         request_id: str,
-        job_id: str
+        job_id: str,
+        now_utc: datetime
     ):
         """
         All personal data processing activities must be logged with complete context.
@@ -243,7 +318,7 @@ class TestLogAllPersonalDataAccess:
             request_id=request_id,
             event_type=AuditEventTypeEnum.DATA_PROCESSING.value,
             actor_id="system_automated_process",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now_utc,
             activity_description=f"Personal data processed for {processing_details['processing_purpose']}",
             legal_basis=processing_details["legal_basis"],
             technical_details={
@@ -295,10 +370,11 @@ class TestAuditLogsAreImmutable:
     
     def test_create_immutable_log__when_audit_event_occurs__stores_tamper_proof_record(
         self,
-        mock_audit_log_repo: Mock,
-        mock_immutable_storage_port: Mock,
-        mock_encryption_port: Mock,
-        tenant_id: str
+        mock_audit_log_repo: SimpleNamespace,
+        mock_immutable_storage_port: SimpleNamespace,
+        mock_encryption_port: SimpleNamespace,
+        tenant_id: str,
+        now_utc: datetime
     ):
         """
         LGPD Article 37: Audit logs must be tamper-proof for regulatory compliance.
@@ -310,7 +386,7 @@ class TestAuditLogsAreImmutable:
         original_log_data = {
             "event_type": AuditEventTypeEnum.CONSENT_GIVEN.value,
             "tenant_id": tenant_id,
-            "timestamp": datetime.now(timezone.utc),
+            "timestamp": now_utc,
             "actor_id": "user_hash_abc123",
             "activity_description": "User provided consent for data processing",
             "legal_basis": "lgpd_article_8_consent"
@@ -339,7 +415,7 @@ class TestAuditLogsAreImmutable:
             record_id=str(uuid4()),
             content_hash=expected_hash,
             log_data=original_log_data,
-            stored_at=datetime.now(timezone.utc),
+            stored_at=now_utc,
             tamper_proof=True
         )
         
@@ -373,10 +449,10 @@ class TestAuditLogsAreImmutable:
     
     def test_attempt_to_modify_immutable_log__when_unauthorized_change__detects_tampering(
         self,
-        mock_audit_log_repo: Mock,
-        mock_immutable_storage_port: Mock,
-        mock_encryption_port: Mock,
-        mock_notification_port: Mock
+        mock_audit_log_repo: SimpleNamespace,
+        mock_immutable_storage_port: SimpleNamespace,
+        mock_encryption_port: SimpleNamespace,
+        mock_notification_port: SimpleNamespace
     ):
         """
         System must detect any attempts to modify immutable audit logs.
@@ -423,11 +499,12 @@ class TestLogsIncludeWhoWhenWhatWhy:
     
     def test_create_comprehensive_audit_log__when_data_subject_request__includes_all_context(
         self,
-        mock_audit_log_repo: Mock,
-        mock_immutable_storage_port: Mock,
-        mock_encryption_port: Mock,
+        mock_audit_log_repo: SimpleNamespace,
+        mock_immutable_storage_port: SimpleNamespace,
+        mock_encryption_port: SimpleNamespace,
         tenant_id: str,
-        request_id: str
+        request_id: str,
+        now_utc: datetime
     ):
         """
         LGPD Article 37: Audit logs must include comprehensive context.
@@ -450,7 +527,7 @@ class TestLogsIncludeWhoWhenWhatWhy:
             "data_subject_id": "user_hash_abc123",  # Same as actor in this case
             
             # WHEN
-            "timestamp": datetime.now(timezone.utc),
+            "timestamp": now_utc,
             "session_id": str(uuid4()),
             
             # WHY 
@@ -563,10 +640,11 @@ class TestNoPersonalDataInLogs:
     
     def test_sanitize_audit_logs__when_personal_data_present__removes_sensitive_information(
         self,
-        mock_audit_log_repo: Mock,
-        mock_immutable_storage_port: Mock,
-        mock_encryption_port: Mock,
-        tenant_id: str
+        mock_audit_log_repo: SimpleNamespace,
+        mock_immutable_storage_port: SimpleNamespace,
+        mock_encryption_port: SimpleNamespace,
+        tenant_id: str,
+        now_utc: datetime
     ):
         """
         LGPD Article 37: Audit logs must not contain personal data themselves.
@@ -614,7 +692,7 @@ class TestNoPersonalDataInLogs:
             event_type=AuditEventTypeEnum.DATA_CORRECTION.value,
             actor_id=sanitized_log_data["user_id_hash"],
             data_subject_id=sanitized_log_data["data_subject_hash"],
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now_utc,
             activity_description="User corrected inaccurate personal data",
             technical_details={
                 "correction_type": sanitized_log_data["correction_type"],
@@ -648,13 +726,13 @@ class TestNoPersonalDataInLogs:
         
         # Verify sanitized data was saved (no personal information)
         saved_entry = mock_audit_log_repo.save_log_entry.call_args[0][0]
-        saved_dict = saved_entry.__dict__
         
-        # Assert no personal data in saved log
-        assert "João Silva" not in str(saved_dict)
-        assert "joao.silva@email.com" not in str(saved_dict)
-        assert "123.456.789-00" not in str(saved_dict)
-        assert "192.168.1.100" not in str(saved_dict)  # Should be generalized
+        # Assert no personal data in saved log (IP address should be generalized)
+        leaked = [
+            value for value in _leaves(saved_entry)
+            if _PERSONAL_DATA_RE.search(str(value))
+        ]
+        assert leaked == []
         
         # Assert necessary information is preserved in safe form
         assert saved_entry.actor_id == "user_hash_a1b2c3d4"  # Consistent hash
@@ -663,9 +741,9 @@ class TestNoPersonalDataInLogs:
     
     def test_reject_unsanitized_logs__when_personal_data_detected__prevents_logging(
         self,
-        mock_audit_log_repo: Mock,
-        mock_immutable_storage_port: Mock,
-        mock_encryption_port: Mock,
+        mock_audit_log_repo: SimpleNamespace,
+        mock_immutable_storage_port: SimpleNamespace,
+        mock_encryption_port: SimpleNamespace,
         tenant_id: str
     ):
         """
@@ -710,8 +788,10 @@ class TestLogRetentionSeparateFromData:
     
     def test_audit_log_retention_policy__when_personal_data_deleted__preserves_audit_logs(
         self,
-        mock_audit_log_repo: Mock,
-        tenant_id: str
+        mock_audit_log_repo: SimpleNamespace,
+        tenant_id: str,
+        now_utc: datetime,
+        uuid_pool: List[str]
     ):
         """
         LGPD Article 37: Audit logs must be retained longer than personal data.
@@ -720,14 +800,13 @@ class TestLogRetentionSeparateFromData:
         for regulatory compliance and accountability purposes.
         """
         # Arrange
-        personal_data_deletion_date = datetime.now(timezone.utc)
-        audit_log_retention_years = 7  # Regulatory requirement
-        expected_audit_retention_until = personal_data_deletion_date + timedelta(days=365 * audit_log_retention_years)
+        personal_data_deletion_date = now_utc
+        expected_audit_retention_until = personal_data_deletion_date + _AUDIT_RETENTION_DELTA
         
         # Audit logs related to deleted personal data
         audit_logs_after_deletion = [
             {
-                "log_id": str(uuid4()),
+                "log_id": uuid_pool[0],
                 "event_type": AuditEventTypeEnum.DATA_DELETION.value,
                 "data_subject_hash": "user_hash_abc123",  # No personal data, just hash
                 "timestamp": personal_data_deletion_date,
@@ -736,7 +815,7 @@ class TestLogRetentionSeparateFromData:
                 "legal_basis": "lgpd_article_18_data_deletion"
             },
             {
-                "log_id": str(uuid4()),
+                "log_id": uuid_pool[1],
                 "event_type": AuditEventTypeEnum.DATA_ACCESS.value,
                 "data_subject_hash": "user_hash_abc123",
                 "timestamp": personal_data_deletion_date - timedelta(days=30),
@@ -749,7 +828,7 @@ class TestLogRetentionSeparateFromData:
         mock_audit_log_repo.update_retention_policy.return_value = {
             "updated": True,
             "logs_affected": 2,
-            "retention_period_years": audit_log_retention_years
+            "retention_period_years": _AUDIT_RETENTION_YEARS
         }
         
         use_case = QueryAuditTrailUseCase(
@@ -761,7 +840,7 @@ class TestLogRetentionSeparateFromData:
             tenant_id=tenant_id,
             data_subject_hash="user_hash_abc123",
             personal_data_deletion_date=personal_data_deletion_date,
-            audit_retention_years=audit_log_retention_years
+            audit_retention_years=_AUDIT_RETENTION_YEARS
         )
         
         # Assert
@@ -771,7 +850,7 @@ class TestLogRetentionSeparateFromData:
         
         # Verify audit logs are retained beyond personal data deletion
         retention_duration = result.audit_retention_until - personal_data_deletion_date
-        assert retention_duration.days >= (365 * audit_log_retention_years)
+        assert retention_duration >= _AUDIT_RETENTION_DELTA
         
         # Verify retention policy was updated
         mock_audit_log_repo.update_retention_policy.assert_called_once_with(
@@ -780,14 +859,60 @@ class TestLogRetentionSeparateFromData:
         )
 
 
+def _stub_compliance_report(
+    audit_log_repo: SimpleNamespace,
+    immutable_storage_port: SimpleNamespace,
+    report_request: "ComplianceReportRequest",
+    report_id: str,
+    now_utc: datetime
+) -> None:
+    """Stub the repository report (filtered to the requested areas) and integrity check."""
+    audit_log_repo.generate_compliance_report.return_value = {
+        "report_id": report_id,
+        "report_generated_at": now_utc,
+        "report_period": f"{report_request.report_period_start.date()} to {report_request.report_period_end.date()}",
+        "total_audit_events": 2847,
+        "compliance_summary": tuple(
+            summary for summary in _COMPREHENSIVE_AUDIT_DATA
+            if summary["event_category"] in report_request.focus_areas
+        ),
+        "regulatory_compliance_score": 99.2,
+        "identified_issues": [
+            {
+                "issue_type": "delayed_deletion",
+                "affected_records": 3,
+                "severity": "low",
+                "remediation_plan": "Scheduled for deletion within 48 hours"
+            }
+        ]
+    }
+    immutable_storage_port.verify_audit_trail_integrity.return_value = {
+        "integrity_verified": True,
+        "total_logs_verified": 2847,
+        "tampered_logs": 0,
+        "verification_timestamp": now_utc
+    }
+
+
 class TestGenerateComplianceReport:
     """Test generation of compliance reports from audit logs."""
     
+    @pytest.fixture(scope="class")
+    def use_case(self, audit_ports):
+        """Report use case wired once per class to the shared port fakes."""
+        return GenerateComplianceReportUseCase(
+            audit_log_repo=audit_ports.audit_log_repo,
+            immutable_storage_port=audit_ports.immutable_storage
+        )
+    
     def test_generate_compliance_report__when_requested_by_authority__provides_comprehensive_audit_trail(
         self,
-        mock_audit_log_repo: Mock,
-        mock_immutable_storage_port: Mock,
-        tenant_id: str
+        use_case,
+        mock_audit_log_repo: SimpleNamespace,
+        mock_immutable_storage_port: SimpleNamespace,
+        tenant_id: str,
+        now_utc: datetime,
+        uuid_pool: List[str]
     ):
         """
         LGPD Article 37: Data controllers must demonstrate compliance to authorities.
@@ -798,71 +923,14 @@ class TestGenerateComplianceReport:
         # Arrange
         report_request = ComplianceReportRequest(
             tenant_id=tenant_id,
-            report_period_start=datetime.now(timezone.utc) - timedelta(days=365),
-            report_period_end=datetime.now(timezone.utc),
+            report_period_start=now_utc - timedelta(days=365),
+            report_period_end=now_utc,
             requested_by="data_protection_authority",
             report_purpose="compliance_audit",
             focus_areas=["data_subject_rights", "consent_management", "data_retention"]
         )
-        
-        comprehensive_audit_data = [
-            # Data subject rights exercises
-            {
-                "event_category": "data_subject_rights",
-                "total_requests": 156,
-                "export_requests": 89,
-                "deletion_requests": 45,
-                "correction_requests": 22,
-                "average_response_time_hours": 18.5,
-                "legal_compliance_rate": 100.0
-            },
-            # Consent management
-            {
-                "event_category": "consent_management", 
-                "consents_given": 1247,
-                "consents_withdrawn": 89,
-                "consent_updates": 203,
-                "processing_stopped_on_withdrawal": 89,
-                "consent_compliance_rate": 100.0
-            },
-            # Data retention
-            {
-                "event_category": "data_retention",
-                "retention_policies_applied": 45,
-                "automatic_deletions": 234,
-                "manual_deletions": 45,
-                "retention_compliance_rate": 98.7,
-                "overdue_deletions": 3
-            }
-        ]
-        
-        mock_audit_log_repo.generate_compliance_report.return_value = {
-            "report_id": str(uuid4()),
-            "report_generated_at": datetime.now(timezone.utc),
-            "report_period": f"{report_request.report_period_start.date()} to {report_request.report_period_end.date()}",
-            "total_audit_events": 2847,
-            "compliance_summary": comprehensive_audit_data,
-            "regulatory_compliance_score": 99.2,
-            "identified_issues": [
-                {
-                    "issue_type": "delayed_deletion",
-                    "affected_records": 3,
-                    "severity": "low",
-                    "remediation_plan": "Scheduled for deletion within 48 hours"
-                }
-            ]
-        }
-        
-        mock_immutable_storage_port.verify_audit_trail_integrity.return_value = {
-            "integrity_verified": True,
-            "total_logs_verified": 2847,
-            "tampered_logs": 0,
-            "verification_timestamp": datetime.now(timezone.utc)
-        }
-        
-        use_case = GenerateComplianceReportUseCase(
-            audit_log_repo=mock_audit_log_repo,
-            immutable_storage_port=mock_immutable_storage_port
+        _stub_compliance_report(
+            mock_audit_log_repo, mock_immutable_storage_port, report_request, uuid_pool[0], now_utc
         )
         
         # Act
@@ -875,17 +943,17 @@ class TestGenerateComplianceReport:
         assert result.audit_trail_integrity_verified is True
         
         # Verify comprehensive compliance data
-        compliance_data = result.compliance_summary
-        assert len(compliance_data) == 3  # Three focus areas
+        by_category = {c["event_category"]: c for c in result.compliance_summary}
+        assert by_category.keys() == {"data_subject_rights", "consent_management", "data_retention"}
         
         # Verify data subject rights compliance
-        dsr_data = next(c for c in compliance_data if c["event_category"] == "data_subject_rights")
+        dsr_data = by_category["data_subject_rights"]
         assert dsr_data["total_requests"] == 156
         assert dsr_data["legal_compliance_rate"] == 100.0
         assert dsr_data["average_response_time_hours"] < 24  # Within LGPD timeframe
         
-        # Verify consent management compliance  
-        consent_data = next(c for c in compliance_data if c["event_category"] == "consent_management")
+        # Verify consent management compliance
+        consent_data = by_category["consent_management"]
         assert consent_data["processing_stopped_on_withdrawal"] == consent_data["consents_withdrawn"]
         
         # Verify issues are identified and tracked
@@ -901,4 +969,40 @@ class TestGenerateComplianceReport:
             period_start=report_request.report_period_start,
             period_end=report_request.report_period_end,
             focus_areas=report_request.focus_areas
+        )
+    
+    def test_generate_compliance_report__when_single_focus_area__reports_only_that_category(
+        self,
+        use_case,
+        mock_audit_log_repo: SimpleNamespace,
+        mock_immutable_storage_port: SimpleNamespace,
+        tenant_id: str,
+        now_utc: datetime,
+        uuid_pool: List[str]
+    ):
+        """Authorities may scope a report; only the requested area is summarized."""
+        # Arrange
+        report_request = ComplianceReportRequest(
+            tenant_id=tenant_id,
+            report_period_start=now_utc - timedelta(days=365),
+            report_period_end=now_utc,
+            requested_by="data_protection_authority",
+            report_purpose="compliance_audit",
+            focus_areas=["data_subject_rights"]
+        )
+        _stub_compliance_report(
+            mock_audit_log_repo, mock_immutable_storage_port, report_request, uuid_pool[0], now_utc
+        )
+        
+        # Act
+        result = use_case.execute(report_request=report_request)
+        
+        # Assert
+        assert result.report_generated is True
+        assert [c["event_category"] for c in result.compliance_summary] == ["data_subject_rights"]
+        mock_audit_log_repo.generate_compliance_report.assert_called_once_with(
+            tenant_id=tenant_id,
+            period_start=report_request.report_period_start,
+            period_end=report_request.report_period_end,
+            focus_areas=["data_subject_rights"]
         )
\ No newline at end of file
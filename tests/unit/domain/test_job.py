@@ -36,6 +36,14 @@ class TestJobCreation:
         assert job.created_at.tzinfo is not None
         assert job.created_at.tzinfo == timezone.utc
     
+    def test_create_job_with_explicit_created_at(self):
+        """Should use the given creation time instead of reading the clock."""
+        created_at = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        
+        job = Job.create(TenantId("t_tenant123"), created_at=created_at)
+        
+        assert job.created_at == created_at
+    
     def test_create_job_with_constructor(self):
         """Should create job with direct constructor."""
         job_id = JobId(uuid4())
@@ -1,5 +1,7 @@
 """Test TenantId edge cases, Unicode handling, and marketplace patterns."""
 
+from dataclasses import asdict
+
 import pytest
 from src.domain.value_objects import TenantId
 
@@ -109,4 +111,14 @@ class TestTenantIdEdgeCases:
         
         # One over maximum: t_ + 48 chars = 50 chars total
         with pytest.raises(ValueError):
-            TenantId("t_" + "a" * 48)
\ No newline at end of file
+            TenantId("t_" + "a" * 48)
+    
+    def test_tenant_id_exposes_normalized_value_bytes(self):
+        """TenantId should expose the UTF-8 encoding of its normalized value."""
+        tenant = TenantId("  T_ACME123  ")
+        assert tenant.value_bytes == b"t_acme123"
+        # Derived encoding is not part of equality or repr
+        assert tenant == TenantId("t_acme123")
+        assert "value_bytes" not in repr(tenant)
+        # ...nor a dataclass field, so asdict-based serialization never sees bytes
+        assert asdict(tenant) == {"value": "t_acme123"}